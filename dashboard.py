@@ -1,170 +1,596 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import numpy as np
-import random
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from streamlit_extras.add_vertical_space import add_vertical_space 
 
-# Define expected columns
-EXPECTED_COLUMNS = [
-    "Sr. No.",
-    "EmpID",
-    "Attendance Code",
-    "FName",
-    "Branch Code",
-    "Department Name",
-    "Division Name",
-    "ReportingEmpCode",
-    "ReportingEmpName",
-    "Grade Code",
-    "Designation Name",
-    "Direct/Indirect",
-    "Roster",
-    "Auto Shift Name",
-    "Date of Joining",
-    "Attendance Date",
-    "In Time",
-    "Out Time",
-    "Total Hours",
-    "OT Hours",
-    "Late Hours",
-    "Application Status",
-    "Final Status",
-    "Attendance Type",
-]
-
-# Load data from Excel
-def load_data(file):
-    xl = pd.ExcelFile(file)
-    sheet_names = xl.sheet_names
-    data = {sheet: xl.parse(sheet) for sheet in sheet_names}
-    return data, sheet_names
-
-# Preprocess data
-def preprocess_data(df):
-    # Keep only expected columns
-    df = df[[col for col in df.columns if col in EXPECTED_COLUMNS]]
-
-    # Ensure all expected columns exist
-    for col in EXPECTED_COLUMNS:
-        if col not in df.columns:
-            df[col] = None
-
-    # Convert columns to string where necessary
-    for col in ["Attendance Code", "Roster", "EmpID"]:  
-        if col in df.columns:
-            df[col] = df[col].astype(str)
-
-    # Convert 'Attendance Date' to datetime safely
-    df["Attendance Date"] = pd.to_datetime(df["Attendance Date"], errors="coerce")
-
-    # Remove rows where 'Attendance Date' couldn't be converted
-    df = df.dropna(subset=["Attendance Date"])
+from utils import build_dataset, dataset_seed, generate_demo_data
+
+# Rows shown per page in the detailed data view
+DATA_PAGE_SIZE = 1000
+
+# Count values, leaving out categories that never occur
+def observed_counts(values):
+    """value_counts without the zero rows a categorical reports for unused categories"""
+    counts = values.value_counts()
+    return counts[counts > 0]
+
+# Sidebar filter options
+def filter_options(values):
+    """Sorted distinct values of a column, read from its categories when it is categorical"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # compact_dtypes builds the categories once per dataset, already in sorted order
+        categories = values.cat.categories
+        if not categories.is_monotonic_increasing:
+            categories = categories.sort_values()
+        return categories.tolist()
+    return sorted(values.unique().tolist())
+
+# Rows matching one sidebar filter value
+def value_mask(values, value):
+    """Compare categorical codes against the value's code instead of matching every label"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        if value not in categories:
+            return np.zeros(len(values), dtype=bool)
+        return values.cat.codes.to_numpy() == categories.get_loc(value)
+    return (values == value).to_numpy()
+
+# Count each Final Status per value of a key column
+def status_table(df, key):
+    """One two-key groupby pivoted to a key-by-status table, faster than pd.crosstab on categoricals"""
+    counts = df.groupby([key, "Final Status"], observed=True).size().unstack(fill_value=0)
+    # Plain string columns, so rate columns can be added next to the status counts
+    counts.columns = counts.columns.astype(str)
+    return counts
+
+# Sidebar filter options for a whole dataset, they never depend on the current selection
+@st.cache_data(show_spinner=False, max_entries=4)
+def sidebar_options(data_key, _df):
+    """Option lists for each sidebar filter column present in the dataset"""
+    return {
+        col: ["All"] + filter_options(_df[col])
+        for col in ["Department Name", "Division Name", "Direct/Indirect", "Auto Shift Name"]
+        if col in _df.columns
+    }
+
+# Count rows per hour of the day
+def hour_counts(hours):
+    """One np.bincount pass over the hour column, already in hour order"""
+    counts = np.bincount(hours.dropna().to_numpy(dtype=np.int64), minlength=24)
+    present = np.flatnonzero(counts)
+    return pd.DataFrame({"Hour": present, "Count": counts[present]})
+
+# Bin numeric values before charting
+def histogram_counts(values, column, bins=20):
+    """Bucket values with np.histogram so the chart only carries one bar per bin"""
+    values = pd.to_numeric(values, errors="coerce").dropna().to_numpy(dtype=float)
+    counts, edges = np.histogram(values, bins=bins)
+    return pd.DataFrame({column: (edges[:-1] + edges[1:]) / 2, "Count": counts})
+
+# Aggregate the General dashboard, cached on the filter selection
+@st.cache_data(show_spinner=False, max_entries=16)
+def general_aggregates(filter_key, _df):
+    """Reduce the filtered data to the metrics and small count tables the General dashboard plots"""
+    # One pass over Final Status feeds both the status chart and the present/absent metrics
+    status_totals = observed_counts(_df["Final Status"])
+    status_counts = status_totals.reset_index()
+    status_counts.columns = ["Status", "Count"]
+
+    dept_counts = observed_counts(_df["Department Name"]).reset_index()
+    dept_counts.columns = ["Department", "Count"]
+
+    att_type_counts = observed_counts(_df["Attendance Type"]).reset_index()
+    att_type_counts.columns = ["Attendance Type", "Count"]
+
+    return {
+        "total_employees": _df["EmpID"].nunique(),
+        "present_count": status_totals.get("P", 0),
+        "absent_count": status_totals.get("Absent", 0),
+        "overtime_hours": _df["OT Hours"].sum(),
+        "status_counts": status_counts,
+        "dept_counts": dept_counts,
+        "att_type_counts": att_type_counts,
+    }
+
+# General dashboard sections, each rendered as its own fragment
+@st.fragment
+def render_metrics(general):
+    with st.container():
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total Employees", general["total_employees"])
+        col2.metric("Present Today", general["present_count"])
+        col3.metric("Absent Today", general["absent_count"])
+        col4.metric("Total Overtime Hours", f"{general['overtime_hours']:.2f}")
+
+# General dashboard distribution charts, cached on the small count tables
+@st.cache_data(show_spinner=False, max_entries=16)
+def dist_figures(general):
+    """Build the status bar and the department and attendance type pies"""
+    figs = {}
+
+    status_counts = general["status_counts"]
+    fig1 = go.Figure([
+        go.Bar(x=[status], y=[count], name=status)
+        for status, count in zip(status_counts["Status"].to_numpy(), status_counts["Count"].to_numpy())
+    ])
+    fig1.update_layout(
+        title="Attendance Status Distribution",
+        xaxis_title="Status",
+        yaxis_title="Count",
+        legend_title_text="Status",
+    )
+    figs["status"] = fig1
+
+    dept_counts = general["dept_counts"]
+    fig2 = go.Figure(go.Pie(
+        labels=dept_counts["Department"].to_numpy(),
+        values=dept_counts["Count"].to_numpy(),
+    ))
+    fig2.update_layout(title="Attendance by Department")
+    figs["dept"] = fig2
+
+    att_type_counts = general["att_type_counts"]
+    fig3 = go.Figure(go.Pie(
+        labels=att_type_counts["Attendance Type"].to_numpy(),
+        values=att_type_counts["Count"].to_numpy(),
+    ))
+    fig3.update_layout(title="Attendance Type Distribution")
+    figs["att_type"] = fig3
+    return figs
+
+@st.fragment
+def render_dist_charts(general):
+    figs = dist_figures(general)
+    with st.container():
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.subheader("Attendance Summary")
+            st.plotly_chart(figs["status"], use_container_width=True)
+
+        with col2:
+            st.subheader("Department-wise Attendance")
+            st.plotly_chart(figs["dept"], use_container_width=True)
+
+        with col3:
+            st.subheader("Attendance Type Distribution")
+            st.plotly_chart(figs["att_type"], use_container_width=True)
+
+# General dashboard time and hours charts, cached on the filter selection
+@st.cache_data(show_spinner=False, max_entries=16)
+def time_figures(filter_key, _df):
+    """Build the peak in/out hour bars and the two hours histograms"""
+    figs = {}
+
+    in_time_counts = hour_counts(_df["In Hour"])
+    fig4 = go.Figure(go.Bar(x=in_time_counts["Hour"].to_numpy(), y=in_time_counts["Count"].to_numpy()))
+    fig4.update_layout(title="Peak In Times", xaxis_title="Hour", yaxis_title="Count")
+    figs["in"] = fig4
+
+    out_time_counts = hour_counts(_df["Out Hour"])
+    fig5 = go.Figure(go.Bar(x=out_time_counts["Hour"].to_numpy(), y=out_time_counts["Count"].to_numpy()))
+    fig5.update_layout(title="Peak Out Times", xaxis_title="Hour", yaxis_title="Count")
+    figs["out"] = fig5
+
+    ot_bins = histogram_counts(_df["OT Hours"], "OT Hours")
+    fig6 = go.Figure(go.Bar(x=ot_bins["OT Hours"].to_numpy(), y=ot_bins["Count"].to_numpy()))
+    fig6.update_layout(
+        title="Overtime Hours Distribution", xaxis_title="OT Hours", yaxis_title="Count", bargap=0
+    )
+    figs["ot"] = fig6
 
-    df = df.fillna(
-        {col: "Unknown" if df[col].dtype == "O" else 0 for col in EXPECTED_COLUMNS}
+    total_bins = histogram_counts(_df["Total Hours"], "Total Hours")
+    fig7 = go.Figure(go.Bar(x=total_bins["Total Hours"].to_numpy(), y=total_bins["Count"].to_numpy()))
+    fig7.update_layout(
+        title="Total Hours Distribution", xaxis_title="Total Hours", yaxis_title="Count", bargap=0
     )
-    return df
+    figs["total"] = fig7
+    return figs
+
+@st.fragment
+def render_time_charts(filter_key, df):
+    figs = time_figures(filter_key, df)
+    with st.container():
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.subheader("Peak In & Out Times")
+            st.plotly_chart(figs["in"], use_container_width=True)
+            st.plotly_chart(figs["out"], use_container_width=True)
+
+        with col2:
+            st.subheader("Overtime Analysis")
+            st.plotly_chart(figs["ot"], use_container_width=True)
+
+        with col3:
+            st.subheader("Total Hours Distribution")
+            st.plotly_chart(figs["total"], use_container_width=True)
+
+# Employee Statistics charts, cached on the selected employee's rows
+@st.cache_data(show_spinner=False, max_entries=32)
+def employee_figures(employee_df):
+    """Build the attendance history, monthly breakdown and overtime charts for one employee"""
+    figs = {}
+
+    # Attendance history
+    # Rows are already sorted by date, so the first row per date is what groupby().first() returned
+    attendance_history = employee_df.drop_duplicates("Attendance Date")[["Attendance Date", "Final Status"]]
+    
+    # Create a color map for status
+    status_colors = {"P": "green", "Absent": "red", "Leave": "blue", "Half Day": "orange"}
+    attendance_history["Color"] = attendance_history["Final Status"].map(status_colors)
+    
+    fig = px.scatter(
+        attendance_history, 
+        x="Attendance Date", 
+        y=[1]*len(attendance_history),
+        color="Final Status",
+        size=[5]*len(attendance_history),
+        title="Attendance Status by Date"
+    )
+    fig.update_layout(yaxis_visible=False)
+    figs["history"] = fig
+
+    # Monthly attendance summary
+    # Count on monthly periods and only format the few resulting months as text
+    month = employee_df["Attendance Date"].dt.to_period("M").rename("Month")
+    monthly_summary = pd.crosstab(month, employee_df["Final Status"])
+    monthly_summary.index = monthly_summary.index.astype(str)
+    
+    if not monthly_summary.empty:
+        figs["monthly"] = px.bar(
+            monthly_summary, 
+            barmode="group",
+            title="Monthly Attendance Breakdown"
+        )
 
-# Generate synthetic data for new metrics
-def generate_synthetic_data(df):
-    """Generate additional data that might not be in the original dataset"""
-    num_employees = df["EmpID"].nunique() or 100
+    # Overtime trends
+    overtime_data = employee_df.groupby("Attendance Date")["OT Hours"].sum().reset_index()
     
-    # Add skill levels (L1, L2, L3, L4)
-    unique_employees = df["EmpID"].unique()
-    skill_levels = {}
-    for emp in unique_employees:
-        skill_levels[emp] = random.choice(["L1", "L2", "L3", "L4"])
+    figs["overtime"] = px.line(
+        overtime_data,
+        x="Attendance Date",
+        y="OT Hours",
+        title="Daily Overtime Hours"
+    )
+    return figs
+
+# Manpower Analysis charts, cached on the filter selection
+@st.cache_data(show_spinner=False, max_entries=16)
+def manpower_figures(filter_key, _df):
+    """Build every Manpower Analysis chart from the filtered frame"""
+    figs = {}
+    # One row per employee, shared by every headcount chart below
+    per_emp = _df.drop_duplicates("EmpID")
+
+    # 1. Availability of Skilled Manpower
+    skill_distribution = observed_counts(per_emp["Skill Level"]).reset_index()
+    skill_distribution.columns = ["Skill Level", "Count"]
     
-    df["Skill Level"] = df["EmpID"].map(skill_levels)
+    figs["skill"] = px.bar(
+        skill_distribution,
+        x="Skill Level",
+        y="Count",
+        color="Skill Level",
+        title="Distribution of Skill Levels"
+    )
     
-    # Add employment type (Permanent/Temporary)
-    employment_types = {}
-    for emp in unique_employees:
-        employment_types[emp] = random.choice(["Permanent", "Temporary"])
+    # 2. Permanent vs Temporary Attendance Monitoring
+    # Group data by date and employment type
+    emp_type_attendance = (
+        _df.groupby(["Attendance Date", "Employment Type"], observed=True)["EmpID"]
+        .nunique()
+        .unstack()
+        .reset_index()
+    )
     
-    df["Employment Type"] = df["EmpID"].map(employment_types)
+    figs["employment"] = px.line(
+        emp_type_attendance,
+        x="Attendance Date",
+        y=emp_type_attendance.columns[1:],
+        title="Attendance Trends by Employment Type",
+        labels={"value": "Employee Count", "variable": "Employment Type"}
+    )
     
-    # Add production line assignment
-    production_lines = {}
-    for emp in unique_employees:
-        production_lines[emp] = f"Line {random.randint(1, 10)}"
+    # 3. Manpower Monitoring Shift Wise with Line Wise
+    # Shift-wise distribution
+    shift_distribution = per_emp.groupby("Auto Shift Name", observed=True, sort=False).size().reset_index()
+    shift_distribution.columns = ["Shift", "Employee Count"]
     
-    df["Production Line"] = df["EmpID"].map(production_lines)
+    figs["shift"] = px.pie(
+        shift_distribution,
+        names="Shift",
+        values="Employee Count",
+        title="Employee Distribution by Shift"
+    )
+    
+    # Line-wise distribution
+    line_distribution = per_emp.groupby("Production Line", observed=True).size().reset_index()
+    line_distribution.columns = ["Production Line", "Employee Count"]
+    
+    figs["line"] = px.bar(
+        line_distribution,
+        x="Production Line",
+        y="Employee Count",
+        title="Employee Distribution by Production Line"
+    )
     
-    # Add gender information
-    genders = {}
-    for emp in unique_employees:
-        genders[emp] = random.choice(["Male", "Female"])
+    # Combined heatmap
+    # Count employees per shift and line in one pass
+    heatmap_data = pd.crosstab(per_emp["Auto Shift Name"], per_emp["Production Line"])
     
-    df["Gender"] = df["EmpID"].map(genders)
+    figs["heatmap"] = px.imshow(
+        heatmap_data,
+        labels=dict(x="Production Line", y="Shift", color="Employee Count"),
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        title="Employee Distribution by Shift and Production Line",
+        color_continuous_scale="Blues"
+    )
+    
+    # 4. Manpower monitoring with Date Range 
+    # Group by date
+    date_manpower = _df.groupby("Attendance Date")["EmpID"].nunique().reset_index()
+    date_manpower.columns = ["Date", "Employee Count"]
+    
+    figs["daily"] = px.line(
+        date_manpower,
+        x="Date",
+        y="Employee Count",
+        title="Daily Manpower Trends"
+    )
     
-    # Add shift information if not present
-    if "Auto Shift Name" not in df.columns or df["Auto Shift Name"].isnull().all():
-        shifts = {}
-        for emp in unique_employees:
-            shifts[emp] = random.choice(["Morning", "Afternoon", "Night"])
-        df["Auto Shift Name"] = df["EmpID"].map(shifts)
+    # 5. Manpower monitoring Gender wise
+    gender_distribution = observed_counts(per_emp["Gender"]).reset_index()
+    gender_distribution.columns = ["Gender", "Count"]
     
-    # Generate historical attendance data
-    today = datetime.now()
-    all_data = []
+    figs["gender"] = px.pie(
+        gender_distribution,
+        names="Gender",
+        values="Count",
+        title="Gender Distribution"
+    )
     
-    # Get range of dates to simulate history
-    date_range = [today - timedelta(days=x) for x in range(180)]
+    # Gender by department
+    gender_dept = per_emp.groupby(["Department Name", "Gender"], observed=True).size().reset_index()
+    gender_dept.columns = ["Department", "Gender", "Count"]
     
-    for emp in unique_employees:
-        emp_rows = df[df["EmpID"] == emp].iloc[0].to_dict() if len(df[df["EmpID"] == emp]) > 0 else {}
+    fig = px.bar(
+        gender_dept,
+        x="Department",
+        y="Count",
+        color="Gender",
+        barmode="group",
+        title="Gender Distribution by Department"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    figs["gender_dept"] = fig
+    return figs
+
+# Attendance Trends charts, cached on the filter selection, the dataset seed and the synthetic frames
+@st.cache_data(show_spinner=False, max_entries=16)
+def trends_figures(filter_key, seed, _df, attrition_df, buffer_df):
+    """Build every Attendance Trends chart, leaving the absenteeism ones out when nobody was absent"""
+    figs = {}
+
+    # 6. Absenteeism graph
+    # Calculate daily absenteeism rate
+    daily_attendance = status_table(_df, "Attendance Date")
+    if "Absent" in daily_attendance.columns:
+        daily_attendance["Absenteeism Rate"] = daily_attendance["Absent"].div(daily_attendance.sum(axis=1)).mul(100)
+        daily_attendance = daily_attendance.reset_index()
         
-        for date in date_range:
-            # Skip weekends with higher probability
-            if date.weekday() >= 5 and random.random() < 0.8:
-                continue
-                
-            attendance_status = random.choices(
-                ["P", "Absent", "Leave", "Half Day"], 
-                weights=[0.85, 0.07, 0.05, 0.03],
-                k=1
-            )[0]
-            
-            # Copy the employee data
-            new_row = emp_rows.copy() if emp_rows else {col: None for col in EXPECTED_COLUMNS}
-            new_row["EmpID"] = emp
-            new_row["Attendance Date"] = date
-            new_row["Final Status"] = attendance_status
-            all_data.append(new_row)
+        figs["absenteeism"] = px.line(
+            daily_attendance,
+            x="Attendance Date",
+            y="Absenteeism Rate",
+            title="Daily Absenteeism Rate (%)"
+        )
     
-    # Create synthetic attrition data
-    attrition_df = pd.DataFrame({
-        "Month": pd.date_range(start=today-timedelta(days=365), end=today, freq='M').strftime('%Y-%m'),
-        "Attrition_Rate": [random.uniform(0.01, 0.08) for _ in range(12)]
-    })
+    # Department-wise absenteeism
+    dept_absence = status_table(_df, "Department Name")
+    if "Absent" in dept_absence.columns:
+        dept_absence["Absenteeism Rate"] = dept_absence["Absent"].div(dept_absence.sum(axis=1)).mul(100)
+        dept_absence = dept_absence.reset_index()
+        
+        fig = px.bar(
+            dept_absence,
+            x="Department Name",
+            y="Absenteeism Rate",
+            title="Absenteeism Rate by Department (%)"
+        )
+        fig.update_layout(xaxis_tickangle=-45)
+        figs["dept_absenteeism"] = fig
     
-    # Create buffer manpower data
-    buffer_df = pd.DataFrame({
-        "Date": pd.date_range(start=today-timedelta(days=30), end=today, freq='D'),
-        "Required": [random.randint(80, 100) for _ in range(31)],
-        "Available": [random.randint(70, 95) for _ in range(31)]
+    # 7. Attrition graph
+    fig = px.line(
+        attrition_df,
+        x="Month",
+        y="Attrition_Rate",
+        title="Monthly Attrition Rate (%)"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    figs["attrition"] = fig
+    
+    # 8. Buffer Manpower Graph
+    figs["buffer"] = px.line(
+        buffer_df,
+        x="Date",
+        y=["Required", "Available"],
+        title="Required vs Available Manpower"
+    )
+    
+    # Calculate buffer percentage on a copy, the cached input must not change
+    buffer_df = buffer_df.copy()
+    required = buffer_df["Required"].to_numpy()
+    available = buffer_df["Available"].to_numpy()
+    buffer_df["Buffer Percentage"] = np.divide(available, required) * 100 - 100
+    
+    figs["buffer_pct"] = px.bar(
+        buffer_df,
+        x="Date",
+        y="Buffer Percentage",
+        title="Buffer Manpower Percentage",
+        color="Buffer Percentage",
+        color_continuous_scale=["red", "yellow", "green"],
+        range_color=[-20, 20]
+    )
+    
+    # 9. Short manpower against available manpower
+    # Calculate shortage
+    buffer_df["Shortage"] = np.maximum(required - available, 0)
+    
+    figs["shortage"] = px.bar(
+        buffer_df,
+        x="Date",
+        y="Shortage",
+        title="Daily Manpower Shortage"
+    )
+    
+    # Department wise shortage (simulated), seeded from the dataset so a rebuilt entry draws the same values
+    rng = np.random.default_rng(seed)
+    dept_list = _df["Department Name"].unique()
+    shortage_by_dept = pd.DataFrame({
+        "Department": dept_list,
+        "Required": rng.integers(15, 31, size=len(dept_list)),
+        "Available": rng.integers(10, 26, size=len(dept_list))
     })
+    shortage_by_dept["Shortage"] = np.maximum(
+        shortage_by_dept["Required"].to_numpy() - shortage_by_dept["Available"].to_numpy(), 0
+    )
+    shortage_by_dept["Shortage Percentage"] = (shortage_by_dept["Shortage"] / shortage_by_dept["Required"]) * 100
+    
+    fig = px.bar(
+        shortage_by_dept,
+        x="Department",
+        y="Shortage Percentage",
+        title="Manpower Shortage by Department (%)"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    figs["dept_shortage"] = fig
+    return figs
+
+# Employee Statistics dashboard, the employee selectbox only reruns this fragment
+@st.fragment
+def render_employee_stats(df):
+    employee_selected = st.selectbox(
+        "Select Employee ID", filter_options(df["EmpID"]))
+    employee_df = df[df["EmpID"] == employee_selected]
+    figs = employee_figures(employee_df)
     
-    # If there's existing data, combine it with the synthetic data
-    if len(df) > 0:
-        synthetic_df = pd.DataFrame(all_data)
-        for col in df.columns:
-            if col not in synthetic_df.columns:
-                synthetic_df[col] = None
+    # Employee details
+    emp_details = employee_df.iloc[0]
+    with st.container():
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Name", emp_details.get("FName", "Unknown"))
+        col2.metric("Department", emp_details.get("Department Name", "Unknown"))
+        col3.metric("Skill Level", emp_details.get("Skill Level", "Unknown"))
+        col4.metric("Employment Type", emp_details.get("Employment Type", "Unknown"))
+    
+    with st.container():
+        col1, col2 = st.columns(2)
+        with col1:
+            # Attendance history
+            st.subheader("Attendance History")
+            st.plotly_chart(figs["history"], use_container_width=True)
         
-        for col in synthetic_df.columns:
-            if col not in df.columns:
-                df[col] = None
-                
-        combined_df = pd.concat([df, synthetic_df])
+        with col2:
+            # Monthly attendance summary
+            st.subheader("Monthly Attendance Summary")
+            if "monthly" in figs:
+                st.plotly_chart(figs["monthly"], use_container_width=True)
+    
+    # Overtime trends
+    st.subheader("Overtime Trends")
+    st.plotly_chart(figs["overtime"], use_container_width=True)
+
+# Manpower Analysis dashboard
+@st.fragment
+def render_manpower(filter_key, df):
+    st.header("Manpower Analysis Dashboard")
+    figs = manpower_figures(filter_key, df)
+    
+    # 1. Availability of Skilled Manpower
+    st.subheader("1. Availability of Skilled Manpower")
+    st.plotly_chart(figs["skill"], use_container_width=True)
+    
+    # 2. Permanent vs Temporary Attendance Monitoring
+    st.subheader("2. Attendance by Employment Type")
+    st.plotly_chart(figs["employment"], use_container_width=True)
+    
+    # 3. Manpower Monitoring Shift Wise with Line Wise
+    st.subheader("3. Manpower by Shift and Production Line")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(figs["shift"], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(figs["line"], use_container_width=True)
+    
+    # Combined heatmap
+    st.subheader("Shift and Production Line Heatmap")
+    st.plotly_chart(figs["heatmap"], use_container_width=True)
+    
+    # 4. Manpower monitoring with Date Range 
+    st.subheader("4. Manpower Trends Over Time")
+    st.plotly_chart(figs["daily"], use_container_width=True)
+    
+    # 5. Manpower monitoring Gender wise
+    st.subheader("5. Gender Distribution Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(figs["gender"], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(figs["gender_dept"], use_container_width=True)
+
+# Attendance Trends dashboard
+@st.fragment
+def render_trends(filter_key, seed, df, attrition_df, buffer_df):
+    st.header("Attendance Trends Dashboard")
+    figs = trends_figures(filter_key, seed, df, attrition_df, buffer_df)
+    
+    # 6. Absenteeism graph
+    st.subheader("6. Absenteeism Trends")
+    if "absenteeism" in figs:
+        st.plotly_chart(figs["absenteeism"], use_container_width=True)
     else:
-        combined_df = pd.DataFrame(all_data)
+        st.write("No absence data available for the selected period.")
+    
+    if "dept_absenteeism" in figs:
+        st.plotly_chart(figs["dept_absenteeism"], use_container_width=True)
     
-    return combined_df, attrition_df, buffer_df
+    # 7. Attrition graph
+    st.subheader("7. Attrition Analysis")
+    st.plotly_chart(figs["attrition"], use_container_width=True)
+    
+    # 8. Buffer Manpower Graph
+    st.subheader("8. Buffer Manpower Analysis")
+    st.plotly_chart(figs["buffer"], use_container_width=True)
+    st.plotly_chart(figs["buffer_pct"], use_container_width=True)
+    
+    # 9. Short manpower against available manpower
+    st.subheader("9. Manpower Shortage Analysis")
+    st.plotly_chart(figs["shortage"], use_container_width=True)
+    st.plotly_chart(figs["dept_shortage"], use_container_width=True)
+
+# Detailed data view, sent to the browser one page at a time
+@st.fragment
+def render_data_view(df):
+    with st.expander("View Full Data"):
+        page_count = max(1, -(-len(df) // DATA_PAGE_SIZE))
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+        start = (page - 1) * DATA_PAGE_SIZE
+        st.caption(f"Rows {min(start + 1, len(df))}-{min(start + DATA_PAGE_SIZE, len(df))} of {len(df)}")
+        # The hour columns only feed the peak time charts
+        st.dataframe(df.iloc[start:start + DATA_PAGE_SIZE].drop(columns=["In Hour", "Out Hour"]))
 
 st.set_page_config(layout="wide")
 st.title("Employee Attendance Dashboard")
@@ -172,1085 +598,149 @@ st.title("Employee Attendance Dashboard")
 uploaded_file = st.file_uploader("Upload Excel File", type=["xls", "xlsx"])
 
 if uploaded_file:
-    data, sheets = load_data(uploaded_file)
-
     # Dashboard Selection
     dashboard_option = st.sidebar.radio(
         "Select Dashboard",
         ["General", "Employee Statistics", "Manpower Analysis", "Attendance Trends"],
     )
 
+    # Synthetic history ends today, so the day is part of every dataset's cache key
+    today = date.today()
+
     try:
         # Process data
-        all_sheets_df = pd.concat([preprocess_data(data[sheet]) for sheet in sheets])
-        # Add synthetic data
-        df, attrition_df, buffer_df = generate_synthetic_data(all_sheets_df)
-        
-        min_date, max_date = df["Attendance Date"].min(), df["Attendance Date"].max()
-        
-        # Filters in sidebar
-        with st.sidebar:
-            add_vertical_space(1)
-            st.subheader("Filters")
-            
-            # Date filter - adjust based on dashboard
-            if dashboard_option in ["General", "Manpower Analysis", "Attendance Trends"]:
-                filter_period = st.selectbox(
-                    "Select Time Period",
-                    ["Daily", "Weekly", "Monthly", "Quarterly", "Yearly"]
-                )
-                
-                if filter_period == "Daily":
-                    start_date, end_date = st.date_input(
-                        "Select Date Range", 
-                        [max_date - timedelta(days=7), max_date], 
-                        min_value=min_date, 
-                        max_value=max_date
-                    )
-                elif filter_period == "Weekly":
-                    start_date = max_date - timedelta(days=30)
-                    end_date = max_date
-                elif filter_period == "Monthly":
-                    start_date = max_date - timedelta(days=90)
-                    end_date = max_date
-                elif filter_period == "Quarterly":
-                    start_date = max_date - timedelta(days=180)
-                    end_date = max_date
-                else:  # Yearly
-                    start_date = max_date - timedelta(days=365)
-                    end_date = max_date
-            else:
-                # For employee stats, just use the whole date range
-                start_date, end_date = min_date, max_date
-            
-            filtered_df = df[(df["Attendance Date"] >= pd.Timestamp(start_date)) & 
-                             (df["Attendance Date"] <= pd.Timestamp(end_date))]
-
-            # Other common filters
-            department_filter = st.selectbox(
-                "Filter by Department",
-                ["All"] + sorted(filtered_df["Department Name"].dropna().unique().tolist()),
-            )
-            
-            division_filter = st.selectbox(
-                "Filter by Division",
-                ["All"] + sorted(filtered_df["Division Name"].dropna().unique().tolist()),
-            )
-            
-            direct_filter = st.selectbox(
-                "Filter by Direct/Indirect",
-                ["All"] + sorted(filtered_df["Direct/Indirect"].dropna().unique().tolist()),
-            )
-            
-            skill_filter = st.selectbox(
-                "Filter by Skill Level",
-                ["All", "L1", "L2", "L3", "L4"],
-            )
-            
-            employment_filter = st.selectbox(
-                "Filter by Employment Type",
-                ["All", "Permanent", "Temporary"],
-            )
-            
-            shift_filter = st.selectbox(
-                "Filter by Shift",
-                ["All"] + sorted(filtered_df["Auto Shift Name"].dropna().unique().tolist()),
-            )
-            
-            # Apply filters
-            if department_filter != "All":
-                filtered_df = filtered_df[filtered_df["Department Name"] == department_filter]
-            if division_filter != "All":
-                filtered_df = filtered_df[filtered_df["Division Name"] == division_filter]
-            if direct_filter != "All":
-                filtered_df = filtered_df[filtered_df["Direct/Indirect"] == direct_filter]
-            if skill_filter != "All":
-                filtered_df = filtered_df[filtered_df["Skill Level"] == skill_filter]
-            if employment_filter != "All":
-                filtered_df = filtered_df[filtered_df["Employment Type"] == employment_filter]
-            if shift_filter != "All":
-                filtered_df = filtered_df[filtered_df["Auto Shift Name"] == shift_filter]
-        
-        # Different dashboard views
-        if dashboard_option == "General":
-            # Metrics
-            total_employees = filtered_df["EmpID"].nunique()
-            present_count = filtered_df[filtered_df["Final Status"] == "P"]["EmpID"].count()
-            absent_count = filtered_df[filtered_df["Final Status"] == "Absent"]["EmpID"].count()
-            overtime_hours = filtered_df["OT Hours"].sum()
-
-            with st.container():
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("Total Employees", total_employees)
-                col2.metric("Present Today", present_count)
-                col3.metric("Absent Today", absent_count)
-                col4.metric("Total Overtime Hours", f"{overtime_hours:.2f}")
-
-            add_vertical_space(2)
-
-            # Graphs
-            with st.container():
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.subheader("Attendance Summary")
-                    status_counts = filtered_df["Final Status"].value_counts().reset_index()
-                    status_counts.columns = ["Status", "Count"]
-                    fig1 = px.bar(
-                        status_counts,
-                        x="Status",
-                        y="Count",
-                        title="Attendance Status Distribution",
-                        color="Status",
-                    )
-                    st.plotly_chart(fig1, use_container_width=True)
-
-                with col2:
-                    st.subheader("Department-wise Attendance")
-                    dept_counts = filtered_df.groupby("Department Name")[
-                        "EmpID"].count().reset_index()
-                    dept_counts.columns = ["Department", "Count"]
-                    fig2 = px.pie(
-                        dept_counts,
-                        names="Department",
-                        values="Count",
-                        title="Attendance by Department",
-                    )
-                    st.plotly_chart(fig2, use_container_width=True)
-
-                with col3:
-                    st.subheader("Attendance Type Distribution")
-                    att_type_counts = filtered_df["Attendance Type"].value_counts().reset_index()
-                    att_type_counts.columns = ["Attendance Type", "Count"]
-                    fig3 = px.pie(
-                        att_type_counts,
-                        names="Attendance Type",
-                        values="Count",
-                        title="Attendance Type Distribution",
-                    )
-                    st.plotly_chart(fig3, use_container_width=True)
-
-            # Additional Graphs from original dashboard
-            with st.container():
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.subheader("Peak In & Out Times")
-                    filtered_df["In Time"] = pd.to_datetime(filtered_df["In Time"], errors="coerce")
-                    filtered_df["Out Time"] = pd.to_datetime(filtered_df["Out Time"], errors="coerce")
-
-                    in_time_counts = filtered_df["In Time"].dt.hour.value_counts().reset_index()
-                    in_time_counts.columns = ["Hour", "Count"]
-                    in_time_counts = in_time_counts.sort_values("Hour")
-                    fig4 = px.bar(in_time_counts, x="Hour",
-                                y="Count", title="Peak In Times")
-                    st.plotly_chart(fig4, use_container_width=True)
-
-                    out_time_counts = filtered_df["Out Time"].dt.hour.value_counts().reset_index()
-                    out_time_counts.columns = ["Hour", "Count"]
-                    out_time_counts = out_time_counts.sort_values("Hour")
-                    fig5 = px.bar(out_time_counts, x="Hour",
-                                y="Count", title="Peak Out Times")
-                    st.plotly_chart(fig5, use_container_width=True)
-
-                with col2:
-                    st.subheader("Overtime Analysis")
-                    fig6 = px.histogram(
-                        filtered_df, x="OT Hours", nbins=20, title="Overtime Hours Distribution"
-                    )
-                    st.plotly_chart(fig6, use_container_width=True)
-
-                with col3:
-                    st.subheader("Total Hours Distribution")
-                    fig7 = px.histogram(
-                        filtered_df, x="Total Hours", nbins=20, title="Total Hours Distribution"
-                    )
-                    st.plotly_chart(fig7, use_container_width=True)
-
-        elif dashboard_option == "Employee Statistics":
-            employee_selected = st.selectbox(
-                "Select Employee ID", sorted(df["EmpID"].unique()))
-            employee_df = df[df["EmpID"] == employee_selected]
-            
-            # Employee details
-            emp_details = employee_df.iloc[0]
-            with st.container():
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("Name", emp_details.get("FName", "Unknown"))
-                col2.metric("Department", emp_details.get("Department Name", "Unknown"))
-                col3.metric("Skill Level", emp_details.get("Skill Level", "Unknown"))
-                col4.metric("Employment Type", emp_details.get("Employment Type", "Unknown"))
-            
-            with st.container():
-                col1, col2 = st.columns(2)
-                with col1:
-                    # Attendance history
-                    st.subheader("Attendance History")
-                    attendance_history = employee_df.groupby("Attendance Date")["Final Status"].first().reset_index()
-                    attendance_history = attendance_history.sort_values("Attendance Date")
-                    
-                    # Create a color map for status
-                    status_colors = {"P": "green", "Absent": "red", "Leave": "blue", "Half Day": "orange"}
-                    attendance_history["Color"] = attendance_history["Final Status"].map(status_colors)
-                    
-                    fig = px.scatter(
-                        attendance_history, 
-                        x="Attendance Date", 
-                        y=[1]*len(attendance_history),
-                        color="Final Status",
-                        size=[5]*len(attendance_history),
-                        title="Attendance Status by Date"
-                    )
-                    fig.update_layout(yaxis_visible=False)
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Monthly attendance summary
-                    st.subheader("Monthly Attendance Summary")
-                    employee_df["Month"] = employee_df["Attendance Date"].dt.strftime('%Y-%m')
-                    monthly_summary = employee_df.groupby("Month")["Final Status"].value_counts().unstack().fillna(0)
-                    
-                    if not monthly_summary.empty:
-                        fig = px.bar(
-                            monthly_summary, 
-                            barmode="group",
-                            title="Monthly Attendance Breakdown"
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
-            
-            # Overtime trends
-            st.subheader("Overtime Trends")
-            overtime_data = employee_df.groupby("Attendance Date")["OT Hours"].sum().reset_index()
-            overtime_data = overtime_data.sort_values("Attendance Date")
-            
-            fig = px.line(
-                overtime_data,
-                x="Attendance Date",
-                y="OT Hours",
-                title="Daily Overtime Hours"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        elif dashboard_option == "Manpower Analysis":
-            st.header("Manpower Analysis Dashboard")
-            
-            # 1. Availability of Skilled Manpower
-            st.subheader("1. Availability of Skilled Manpower")
-            skill_distribution = filtered_df.drop_duplicates("EmpID")["Skill Level"].value_counts().reset_index()
-            skill_distribution.columns = ["Skill Level", "Count"]
-            
-            fig = px.bar(
-                skill_distribution,
-                x="Skill Level",
-                y="Count",
-                color="Skill Level",
-                title="Distribution of Skill Levels"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 2. Permanent vs Temporary Attendance Monitoring
-            st.subheader("2. Attendance by Employment Type")
-            # Group data by date and employment type
-            emp_type_attendance = filtered_df.groupby(["Attendance Date", "Employment Type"])["EmpID"].nunique().reset_index()
-            emp_type_attendance = emp_type_attendance.pivot(index="Attendance Date", columns="Employment Type", values="EmpID").reset_index()
-            
-            fig = px.line(
-                emp_type_attendance,
-                x="Attendance Date",
-                y=emp_type_attendance.columns[1:],
-                title="Attendance Trends by Employment Type",
-                labels={"value": "Employee Count", "variable": "Employment Type"}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 3. Manpower Monitoring Shift Wise with Line Wise
-            st.subheader("3. Manpower by Shift and Production Line")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Shift-wise distribution
-                shift_distribution = filtered_df.drop_duplicates("EmpID").groupby("Auto Shift Name")["EmpID"].count().reset_index()
-                shift_distribution.columns = ["Shift", "Employee Count"]
-                
-                fig = px.pie(
-                    shift_distribution,
-                    names="Shift",
-                    values="Employee Count",
-                    title="Employee Distribution by Shift"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Line-wise distribution
-                line_distribution = filtered_df.drop_duplicates("EmpID").groupby("Production Line")["EmpID"].count().reset_index()
-                line_distribution.columns = ["Production Line", "Employee Count"]
-                
-                fig = px.bar(
-                    line_distribution,
-                    x="Production Line",
-                    y="Employee Count",
-                    title="Employee Distribution by Production Line"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Combined heatmap
-            st.subheader("Shift and Production Line Heatmap")
-            shift_line_heatmap = filtered_df.drop_duplicates("EmpID").groupby(["Auto Shift Name", "Production Line"])["EmpID"].count().reset_index()
-            shift_line_heatmap.columns = ["Shift", "Production Line", "Employee Count"]
-            
-            # Create pivot table for heatmap
-            heatmap_data = shift_line_heatmap.pivot(index="Shift", columns="Production Line", values="Employee Count").fillna(0)
-            
-            fig = px.imshow(
-                heatmap_data,
-                labels=dict(x="Production Line", y="Shift", color="Employee Count"),
-                x=heatmap_data.columns,
-                y=heatmap_data.index,
-                title="Employee Distribution by Shift and Production Line",
-                color_continuous_scale="Blues"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 4. Manpower monitoring with Date Range 
-            st.subheader("4. Manpower Trends Over Time")
-            
-            # Group by date
-            date_manpower = filtered_df.groupby("Attendance Date")["EmpID"].nunique().reset_index()
-            date_manpower.columns = ["Date", "Employee Count"]
-            
-            fig = px.line(
-                date_manpower,
-                x="Date",
-                y="Employee Count",
-                title="Daily Manpower Trends"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 5. Manpower monitoring Gender wise
-            st.subheader("5. Gender Distribution Analysis")
-            
-            gender_distribution = filtered_df.drop_duplicates("EmpID")["Gender"].value_counts().reset_index()
-            gender_distribution.columns = ["Gender", "Count"]
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig = px.pie(
-                    gender_distribution,
-                    names="Gender",
-                    values="Count",
-                    title="Gender Distribution"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Gender by department
-                gender_dept = filtered_df.drop_duplicates("EmpID").groupby(["Department Name", "Gender"])["EmpID"].count().reset_index()
-                gender_dept.columns = ["Department", "Gender", "Count"]
-                
-                fig = px.bar(
-                    gender_dept,
-                    x="Department",
-                    y="Count",
-                    color="Gender",
-                    barmode="group",
-                    title="Gender Distribution by Department"
-                )
-                fig.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig, use_container_width=True)
-        
-        elif dashboard_option == "Attendance Trends":
-            st.header("Attendance Trends Dashboard")
-            
-            # 6. Absenteeism graph
-            st.subheader("6. Absenteeism Trends")
-            
-            # Calculate daily absenteeism rate
-            daily_attendance = filtered_df.groupby("Attendance Date")["Final Status"].value_counts().unstack().fillna(0)
-            if "Absent" in daily_attendance.columns:
-                daily_attendance["Absenteeism Rate"] = daily_attendance["Absent"] / daily_attendance.sum(axis=1) * 100
-                daily_attendance = daily_attendance.reset_index()
-                
-                fig = px.line(
-                    daily_attendance,
-                    x="Attendance Date",
-                    y="Absenteeism Rate",
-                    title="Daily Absenteeism Rate (%)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.write("No absence data available for the selected period.")
-            
-            # Department-wise absenteeism
-            dept_absence = filtered_df.groupby("Department Name")["Final Status"].value_counts().unstack().fillna(0)
-            if "Absent" in dept_absence.columns:
-                dept_absence["Absenteeism Rate"] = dept_absence["Absent"] / dept_absence.sum(axis=1) * 100
-                dept_absence = dept_absence.reset_index()
-                
-                fig = px.bar(
-                    dept_absence,
-                    x="Department Name",
-                    y="Absenteeism Rate",
-                    title="Absenteeism Rate by Department (%)"
-                )
-                fig.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # 7. Attrition graph
-            st.subheader("7. Attrition Analysis")
-            
-            fig = px.line(
-                attrition_df,
-                x="Month",
-                y="Attrition_Rate",
-                title="Monthly Attrition Rate (%)"
-            )
-            fig.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 8. Buffer Manpower Graph
-            st.subheader("8. Buffer Manpower Analysis")
-            
-            fig = px.line(
-                buffer_df,
-                x="Date",
-                y=["Required", "Available"],
-                title="Required vs Available Manpower"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Calculate buffer percentage
-            buffer_df["Buffer Percentage"] = (buffer_df["Available"] / buffer_df["Required"]) * 100 - 100
-            
-            fig = px.bar(
-                buffer_df,
-                x="Date",
-                y="Buffer Percentage",
-                title="Buffer Manpower Percentage",
-                color="Buffer Percentage",
-                color_continuous_scale=["red", "yellow", "green"],
-                range_color=[-20, 20]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 9. Short manpower against available manpower
-            st.subheader("9. Manpower Shortage Analysis")
-            
-            # Calculate shortage
-            buffer_df["Shortage"] = buffer_df["Required"] - buffer_df["Available"]
-            buffer_df["Shortage"] = buffer_df["Shortage"].apply(lambda x: max(x, 0))
-            
-            fig = px.bar(
-                buffer_df,
-                x="Date",
-                y="Shortage",
-                title="Daily Manpower Shortage"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Department wise shortage (simulated)
-            dept_list = filtered_df["Department Name"].unique()
-            shortage_by_dept = pd.DataFrame({
-                "Department": dept_list,
-                "Required": [random.randint(15, 30) for _ in range(len(dept_list))],
-                "Available": [random.randint(10, 25) for _ in range(len(dept_list))]
-            })
-            shortage_by_dept["Shortage"] = shortage_by_dept["Required"] - shortage_by_dept["Available"]
-            shortage_by_dept["Shortage"] = shortage_by_dept["Shortage"].apply(lambda x: max(x, 0))
-            shortage_by_dept["Shortage Percentage"] = (shortage_by_dept["Shortage"] / shortage_by_dept["Required"]) * 100
-            
-            fig = px.bar(
-                shortage_by_dept,
-                x="Department",
-                y="Shortage Percentage",
-                title="Manpower Shortage by Department (%)"
-            )
-            fig.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Detailed Data View (Common)
-        st.subheader("Detailed Data View")
-        with st.expander("View Full Data"):
-            st.dataframe(filtered_df)
-    
+        file_bytes = uploaded_file.getvalue()
+        seed = dataset_seed(file_bytes)
+        df, attrition_df, buffer_df = build_dataset(file_bytes, today)
+        data_key = (uploaded_file.file_id, today)
     except Exception as e:
         st.error(f"An error occurred while processing the data: {e}")
         st.info("Using demo data instead...")
+        seed = 0
+        df, attrition_df, buffer_df = generate_demo_data(today, seed)
+        data_key = ("demo", today)
+        st.info("Using demo data - upload an Excel file for actual analysis")
+
+    # Rows are sorted by date, so the range ends are the first and last rows
+    min_date, max_date = df["Attendance Date"].iloc[0], df["Attendance Date"].iloc[-1]
+    options = sidebar_options(data_key, df)
+    
+    # Filters in sidebar
+    with st.sidebar:
+        add_vertical_space(1)
+        st.subheader("Filters")
         
-        # Generate completely synthetic data for demo
-        from datetime import datetime, timedelta
-        
-        # Generate sample employee data
-        num_employees = 100
-        departments = ["Production", "Quality", "Maintenance", "HR", "Administration"]
-        divisions = ["A", "B", "C"]
-        skill_levels = ["L1", "L2", "L3", "L4"]
-        shifts = ["Morning", "Afternoon", "Night"]
-        genders = ["Male", "Female"]
-        
-        # Generate employee base data
-        employee_data = []
-        for i in range(1, num_employees + 1):
-            emp_id = f"EMP{i:03d}"
-            department = random.choice(departments)
-            division = random.choice(divisions)
-            skill_level = random.choice(skill_levels)
-            shift = random.choice(shifts)
-            gender = random.choice(genders)
-            emp_type = random.choice(["Permanent", "Temporary"])
-            line = f"Line {random.randint(1, 10)}"
+        # Date filter - adjust based on dashboard
+        if dashboard_option in ["General", "Manpower Analysis", "Attendance Trends"]:
+            filter_period = st.selectbox(
+                "Select Time Period",
+                ["Daily", "Weekly", "Monthly", "Quarterly", "Yearly"]
+            )
             
-            employee_data.append({
-                "EmpID": emp_id,
-                "FName": f"Employee {i}",
-                "Department Name": department,
-                "Division Name": division,
-                "Skill Level": skill_level,
-                "Auto Shift Name": shift,
-                "Gender": gender,
-                "Employment Type": emp_type,
-                "Production Line": line
-            })
-        
-        # Generate attendance data
-        attendance_data = []
-        today = datetime.now()
-        
-        for day in range(90):
-            date = today - timedelta(days=day)
-            for emp in employee_data:
-                # Skip weekends with higher probability
-                if date.weekday() >= 5 and random.random() < 0.8:
-                    continue
-                    
-                status = random.choices(
-                    ["P", "Absent", "Leave", "Half Day"], 
-                    weights=[0.85, 0.07, 0.05, 0.03],
-                    k=1
-                )[0]
-                
-                in_time = datetime.combine(date.date(), datetime.min.time()) + timedelta(hours=8, minutes=random.randint(0, 60))
-                out_time = in_time + timedelta(hours=8, minutes=random.randint(0, 60))
-                total_hours = (out_time - in_time).total_seconds() / 3600
-                
-                # Add attendance record
-                attendance_data.append({
-                    **emp,
-                    "Attendance Date": date,
-                    "Final Status": status,
-                    "In Time": in_time if status in ["P", "Half Day"] else None,
-                    "Out Time": out_time if status in ["P", "Half Day"] else None,
-                    "Total Hours": total_hours if status in ["P", "Half Day"] else 0,
-                    "OT Hours": max(0, total_hours - 8) if status == "P" else 0,
-                    "Late Hours": random.uniform(0, 1) if random.random() < 0.2 else 0,
-                    "Attendance Type": "Regular" if status == "P" else status
-                })
-        
-        # Create dataframe
-        df = pd.DataFrame(attendance_data)
-        
-        # Create synthetic attrition data
-        attrition_df = pd.DataFrame({
-            "Month": pd.date_range(start=today-timedelta(days=365), end=today, freq='M').strftime('%Y-%m'),
-            "Attrition_Rate": [random.uniform(0.01, 0.08) for _ in range(12)]
-        })
+            if filter_period == "Daily":
+                start_date, end_date = st.date_input(
+                    "Select Date Range", 
+                    [max_date - timedelta(days=7), max_date], 
+                    min_value=min_date, 
+                    max_value=max_date
+                )
+            elif filter_period == "Weekly":
+                start_date = max_date - timedelta(days=30)
+                end_date = max_date
+            elif filter_period == "Monthly":
+                start_date = max_date - timedelta(days=90)
+                end_date = max_date
+            elif filter_period == "Quarterly":
+                start_date = max_date - timedelta(days=180)
+                end_date = max_date
+            else:  # Yearly
+                start_date = max_date - timedelta(days=365)
+                end_date = max_date
+        else:
+            # For employee stats, just use the whole date range
+            start_date, end_date = min_date, max_date
         
-        # Create buffer manpower data
-        buffer_df = pd.DataFrame({
-            "Date": pd.date_range(start=today-timedelta(days=30), end=today, freq='D'),
-            "Required": [random.randint(80, 100) for _ in range(31)],
-            "Available": [random.randint(70, 95) for _ in range(31)]
-        })
+        # Other common filters
+        department_filter = st.selectbox(
+            "Filter by Department",
+            options["Department Name"],
+        )
         
-        # Display dashboard with demo data
-        dashboard_option = st.sidebar.radio(
-            "Select Dashboard",
-            ["General", "Employee Statistics", "Manpower Analysis", "Attendance Trends"],
+        division_filter = st.selectbox(
+            "Filter by Division",
+            options["Division Name"],
         )
-
-        min_date, max_date = df["Attendance Date"].min(), df["Attendance Date"].max()
         
-        # Filters in sidebar
-        with st.sidebar:
-            add_vertical_space(1)
-            st.subheader("Filters")
-            
-            # Date filter - adjust based on dashboard
-            if dashboard_option in ["General", "Manpower Analysis", "Attendance Trends"]:
-                filter_period = st.selectbox(
-                    "Select Time Period",
-                    ["Daily", "Weekly", "Monthly", "Quarterly", "Yearly"]
-                )
-                
-                if filter_period == "Daily":
-                    start_date, end_date = st.date_input(
-                        "Select Date Range", 
-                        [max_date - timedelta(days=7), max_date], 
-                        min_value=min_date, 
-                        max_value=max_date
-                    )
-                elif filter_period == "Weekly":
-                    start_date = max_date - timedelta(days=30)
-                    end_date = max_date
-                elif filter_period == "Monthly":
-                    start_date = max_date - timedelta(days=90)
-                    end_date = max_date
-                elif filter_period == "Quarterly":
-                    start_date = max_date - timedelta(days=180)
-                    end_date = max_date
-                else:  # Yearly
-                    start_date = max_date - timedelta(days=365)
-                    end_date = max_date
-            else:
-                # For employee stats, just use the whole date range
-                start_date, end_date = min_date, max_date
-            
-            filtered_df = df[(df["Attendance Date"] >= pd.Timestamp(start_date)) & 
-                            (df["Attendance Date"] <= pd.Timestamp(end_date))]
-
-            # Other common filters
-            department_filter = st.selectbox(
-                "Filter by Department",
-                ["All"] + sorted(filtered_df["Department Name"].dropna().unique().tolist()),
-            )
-            
-            division_filter = st.selectbox(
-                "Filter by Division",
-                ["All"] + sorted(filtered_df["Division Name"].dropna().unique().tolist()),
-            )
-            
-            skill_filter = st.selectbox(
-                "Filter by Skill Level",
-                ["All", "L1", "L2", "L3", "L4"],
-            )
-            
-            employment_filter = st.selectbox(
-                "Filter by Employment Type",
-                ["All", "Permanent", "Temporary"],
-            )
-            
-            shift_filter = st.selectbox(
-                "Filter by Shift",
-                ["All"] + sorted(filtered_df["Auto Shift Name"].dropna().unique().tolist()),
+        # Demo data has no Direct/Indirect column
+        direct_filter = "All"
+        if "Direct/Indirect" in options:
+            direct_filter = st.selectbox(
+                "Filter by Direct/Indirect",
+                options["Direct/Indirect"],
             )
-            
-            # Apply filters
-            if department_filter != "All":
-                filtered_df = filtered_df[filtered_df["Department Name"] == department_filter]
-            if division_filter != "All":
-                filtered_df = filtered_df[filtered_df["Division Name"] == division_filter]
-            if skill_filter != "All":
-                filtered_df = filtered_df[filtered_df["Skill Level"] == skill_filter]
-            if employment_filter != "All":
-                filtered_df = filtered_df[filtered_df["Employment Type"] == employment_filter]
-            if shift_filter != "All":
-                filtered_df = filtered_df[filtered_df["Auto Shift Name"] == shift_filter]
-                
-        # Display the selected dashboard
-        st.info("Using demo data - upload an Excel file for actual analysis")
-        
-        if dashboard_option == "General":
-            # Metrics
-            total_employees = filtered_df["EmpID"].nunique()
-            present_count = filtered_df[filtered_df["Final Status"] == "P"]["EmpID"].count()
-            absent_count = filtered_df[filtered_df["Final Status"] == "Absent"]["EmpID"].count()
-            overtime_hours = filtered_df["OT Hours"].sum()
-
-            with st.container():
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("Total Employees", total_employees)
-                col2.metric("Present Today", present_count)
-                col3.metric("Absent Today", absent_count)
-                col4.metric("Total Overtime Hours", f"{overtime_hours:.2f}")
-
-            add_vertical_space(2)
-
-            # Graphs
-            with st.container():
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.subheader("Attendance Summary")
-                    status_counts = filtered_df["Final Status"].value_counts().reset_index()
-                    status_counts.columns = ["Status", "Count"]
-                    fig1 = px.bar(
-                        status_counts,
-                        x="Status",
-                        y="Count",
-                        title="Attendance Status Distribution",
-                        color="Status",
-                    )
-                    st.plotly_chart(fig1, use_container_width=True)
-
-                with col2:
-                    st.subheader("Department-wise Attendance")
-                    dept_counts = filtered_df.groupby("Department Name")[
-                        "EmpID"].count().reset_index()
-                    dept_counts.columns = ["Department", "Count"]
-                    fig2 = px.pie(
-                        dept_counts,
-                        names="Department",
-                        values="Count",
-                        title="Attendance by Department",
-                    )
-                    st.plotly_chart(fig2, use_container_width=True)
-
-                with col3:
-                    st.subheader("Attendance Type Distribution")
-                    att_type_counts = filtered_df["Attendance Type"].value_counts().reset_index()
-                    att_type_counts.columns = ["Attendance Type", "Count"]
-                    fig3 = px.pie(
-                        att_type_counts,
-                        names="Attendance Type",
-                        values="Count",
-                        title="Attendance Type Distribution",
-                    )
-                    st.plotly_chart(fig3, use_container_width=True)
-
-            # Additional Graphs from original dashboard
-            with st.container():
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.subheader("Peak In & Out Times")
-                    filtered_df["In Time"] = pd.to_datetime(filtered_df["In Time"], errors="coerce")
-                    filtered_df["Out Time"] = pd.to_datetime(filtered_df["Out Time"], errors="coerce")
-
-                    in_time_counts = filtered_df["In Time"].dt.hour.value_counts().reset_index()
-                    in_time_counts.columns = ["Hour", "Count"]
-                    in_time_counts = in_time_counts.sort_values("Hour")
-                    fig4 = px.bar(in_time_counts, x="Hour",
-                                y="Count", title="Peak In Times")
-                    st.plotly_chart(fig4, use_container_width=True)
-
-                    out_time_counts = filtered_df["Out Time"].dt.hour.value_counts().reset_index()
-                    out_time_counts.columns = ["Hour", "Count"]
-                    out_time_counts = out_time_counts.sort_values("Hour")
-                    fig5 = px.bar(out_time_counts, x="Hour",
-                                y="Count", title="Peak Out Times")
-                    st.plotly_chart(fig5, use_container_width=True)
-
-                with col2:
-                    st.subheader("Overtime Analysis")
-                    fig6 = px.histogram(
-                        filtered_df, x="OT Hours", nbins=20, title="Overtime Hours Distribution"
-                    )
-                    st.plotly_chart(fig6, use_container_width=True)
-
-                with col3:
-                    st.subheader("Total Hours Distribution")
-                    fig7 = px.histogram(
-                        filtered_df, x="Total Hours", nbins=20, title="Total Hours Distribution"
-                    )
-                    st.plotly_chart(fig7, use_container_width=True)
         
-        elif dashboard_option == "Employee Statistics":
-            employee_selected = st.selectbox(
-                "Select Employee ID", sorted(df["EmpID"].unique()))
-            employee_df = df[df["EmpID"] == employee_selected]
-            
-            # Employee details
-            emp_details = employee_df.iloc[0]
-            with st.container():
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("Name", emp_details.get("FName", "Unknown"))
-                col2.metric("Department", emp_details.get("Department Name", "Unknown"))
-                col3.metric("Skill Level", emp_details.get("Skill Level", "Unknown"))
-                col4.metric("Employment Type", emp_details.get("Employment Type", "Unknown"))
-            
-            with st.container():
-                col1, col2 = st.columns(2)
-                with col1:
-                    # Attendance history
-                    st.subheader("Attendance History")
-                    attendance_history = employee_df.groupby("Attendance Date")["Final Status"].first().reset_index()
-                    attendance_history = attendance_history.sort_values("Attendance Date")
-                    
-                    # Create a color map for status
-                    status_colors = {"P": "green", "Absent": "red", "Leave": "blue", "Half Day": "orange"}
-                    attendance_history["Color"] = attendance_history["Final Status"].map(status_colors)
-                    
-                    fig = px.scatter(
-                        attendance_history, 
-                        x="Attendance Date", 
-                        y=[1]*len(attendance_history),
-                        color="Final Status",
-                        size=[5]*len(attendance_history),
-                        title="Attendance Status by Date"
-                    )
-                    fig.update_layout(yaxis_visible=False)
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Monthly attendance summary
-                    st.subheader("Monthly Attendance Summary")
-                    employee_df["Month"] = employee_df["Attendance Date"].dt.strftime('%Y-%m')
-                    monthly_summary = employee_df.groupby("Month")["Final Status"].value_counts().unstack().fillna(0)
-                    
-                    if not monthly_summary.empty:
-                        fig = px.bar(
-                            monthly_summary, 
-                            barmode="group",
-                            title="Monthly Attendance Breakdown"
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
-            
-            # Overtime trends
-            st.subheader("Overtime Trends")
-            overtime_data = employee_df.groupby("Attendance Date")["OT Hours"].sum().reset_index()
-            overtime_data = overtime_data.sort_values("Attendance Date")
-            
-            fig = px.line(
-                overtime_data,
-                x="Attendance Date",
-                y="OT Hours",
-                title="Daily Overtime Hours"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        skill_filter = st.selectbox(
+            "Filter by Skill Level",
+            ["All", "L1", "L2", "L3", "L4"],
+        )
         
-        elif dashboard_option == "Manpower Analysis":
-            st.header("Manpower Analysis Dashboard")
-            
-            # 1. Availability of Skilled Manpower
-            st.subheader("1. Availability of Skilled Manpower")
-            skill_distribution = filtered_df.drop_duplicates("EmpID")["Skill Level"].value_counts().reset_index()
-            skill_distribution.columns = ["Skill Level", "Count"]
-            
-            fig = px.bar(
-                skill_distribution,
-                x="Skill Level",
-                y="Count",
-                color="Skill Level",
-                title="Distribution of Skill Levels"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 2. Permanent vs Temporary Attendance Monitoring
-            st.subheader("2. Attendance by Employment Type")
-            # Group data by date and employment type
-            emp_type_attendance = filtered_df.groupby(["Attendance Date", "Employment Type"])["EmpID"].nunique().reset_index()
-            emp_type_attendance = emp_type_attendance.pivot(index="Attendance Date", columns="Employment Type", values="EmpID").reset_index()
-            
-            fig = px.line(
-                emp_type_attendance,
-                x="Attendance Date",
-                y=emp_type_attendance.columns[1:],
-                title="Attendance Trends by Employment Type",
-                labels={"value": "Employee Count", "variable": "Employment Type"}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 3. Manpower Monitoring Shift Wise with Line Wise
-            st.subheader("3. Manpower by Shift and Production Line")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Shift-wise distribution
-                shift_distribution = filtered_df.drop_duplicates("EmpID").groupby("Auto Shift Name")["EmpID"].count().reset_index()
-                shift_distribution.columns = ["Shift", "Employee Count"]
-                
-                fig = px.pie(
-                    shift_distribution,
-                    names="Shift",
-                    values="Employee Count",
-                    title="Employee Distribution by Shift"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Line-wise distribution
-                line_distribution = filtered_df.drop_duplicates("EmpID").groupby("Production Line")["EmpID"].count().reset_index()
-                line_distribution.columns = ["Production Line", "Employee Count"]
-                
-                fig = px.bar(
-                    line_distribution,
-                    x="Production Line",
-                    y="Employee Count",
-                    title="Employee Distribution by Production Line"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Combined heatmap
-            st.subheader("Shift and Production Line Heatmap")
-            shift_line_heatmap = filtered_df.drop_duplicates("EmpID").groupby(["Auto Shift Name", "Production Line"])["EmpID"].count().reset_index()
-            shift_line_heatmap.columns = ["Shift", "Production Line", "Employee Count"]
-            
-            # Create pivot table for heatmap
-            heatmap_data = shift_line_heatmap.pivot(index="Shift", columns="Production Line", values="Employee Count").fillna(0)
-            
-            fig = px.imshow(
-                heatmap_data,
-                labels=dict(x="Production Line", y="Shift", color="Employee Count"),
-                x=heatmap_data.columns,
-                y=heatmap_data.index,
-                title="Employee Distribution by Shift and Production Line",
-                color_continuous_scale="Blues"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 4. Manpower monitoring with Date Range 
-            st.subheader("4. Manpower Trends Over Time")
-            
-            # Group by date
-            date_manpower = filtered_df.groupby("Attendance Date")["EmpID"].nunique().reset_index()
-            date_manpower.columns = ["Date", "Employee Count"]
-            
-            fig = px.line(
-                date_manpower,
-                x="Date",
-                y="Employee Count",
-                title="Daily Manpower Trends"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 5. Manpower monitoring Gender wise
-            st.subheader("5. Gender Distribution Analysis")
-            
-            gender_distribution = filtered_df.drop_duplicates("EmpID")["Gender"].value_counts().reset_index()
-            gender_distribution.columns = ["Gender", "Count"]
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig = px.pie(
-                    gender_distribution,
-                    names="Gender",
-                    values="Count",
-                    title="Gender Distribution"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                # Gender by department
-                gender_dept = filtered_df.drop_duplicates("EmpID").groupby(["Department Name", "Gender"])["EmpID"].count().reset_index()
-                gender_dept.columns = ["Department", "Gender", "Count"]
-                
-                fig = px.bar(
-                    gender_dept,
-                    x="Department",
-                    y="Count",
-                    color="Gender",
-                    barmode="group",
-                    title="Gender Distribution by Department"
-                )
-                fig.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig, use_container_width=True)
+        employment_filter = st.selectbox(
+            "Filter by Employment Type",
+            ["All", "Permanent", "Temporary"],
+        )
         
-        elif dashboard_option == "Attendance Trends":
-            st.header("Attendance Trends Dashboard")
-            
-            # 6. Absenteeism graph
-            st.subheader("6. Absenteeism Trends")
-            
-            # Calculate daily absenteeism rate
-            daily_attendance = filtered_df.groupby("Attendance Date")["Final Status"].value_counts().unstack().fillna(0)
-            if "Absent" in daily_attendance.columns:
-                daily_attendance["Absenteeism Rate"] = daily_attendance["Absent"] / daily_attendance.sum(axis=1) * 100
-                daily_attendance = daily_attendance.reset_index()
-                
-                fig = px.line(
-                    daily_attendance,
-                    x="Attendance Date",
-                    y="Absenteeism Rate",
-                    title="Daily Absenteeism Rate (%)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.write("No absence data available for the selected period.")
-            
-            # Department-wise absenteeism
-            dept_absence = filtered_df.groupby("Department Name")["Final Status"].value_counts().unstack().fillna(0)
-            if "Absent" in dept_absence.columns:
-                dept_absence["Absenteeism Rate"] = dept_absence["Absent"] / dept_absence.sum(axis=1) * 100
-                dept_absence = dept_absence.reset_index()
-                
-                fig = px.bar(
-                    dept_absence,
-                    x="Department Name",
-                    y="Absenteeism Rate",
-                    title="Absenteeism Rate by Department (%)"
-                )
-                fig.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # 7. Attrition graph
-            st.subheader("7. Attrition Analysis")
-            
-            fig = px.line(
-                attrition_df,
-                x="Month",
-                y="Attrition_Rate",
-                title="Monthly Attrition Rate (%)"
-            )
-            fig.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 8. Buffer Manpower Graph
-            st.subheader("8. Buffer Manpower Analysis")
-            
-            fig = px.line(
-                buffer_df,
-                x="Date",
-                y=["Required", "Available"],
-                title="Required vs Available Manpower"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Calculate buffer percentage
-            buffer_df["Buffer Percentage"] = (buffer_df["Available"] / buffer_df["Required"]) * 100 - 100
-            
-            fig = px.bar(
-                buffer_df,
-                x="Date",
-                y="Buffer Percentage",
-                title="Buffer Manpower Percentage",
-                color="Buffer Percentage",
-                color_continuous_scale=["red", "yellow", "green"],
-                range_color=[-20, 20]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # 9. Short manpower against available manpower
-            st.subheader("9. Manpower Shortage Analysis")
-            
-            # Calculate shortage
-            buffer_df["Shortage"] = buffer_df["Required"] - buffer_df["Available"]
-            buffer_df["Shortage"] = buffer_df["Shortage"].apply(lambda x: max(x, 0))
-            
-            fig = px.bar(
-                buffer_df,
-                x="Date",
-                y="Shortage",
-                title="Daily Manpower Shortage"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Department wise shortage (simulated)
-            dept_list = filtered_df["Department Name"].unique()
-            shortage_by_dept = pd.DataFrame({
-                "Department": dept_list,
-                "Required": [random.randint(15, 30) for _ in range(len(dept_list))],
-                "Available": [random.randint(10, 25) for _ in range(len(dept_list))]
-            })
-            shortage_by_dept["Shortage"] = shortage_by_dept["Required"] - shortage_by_dept["Available"]
-            shortage_by_dept["Shortage"] = shortage_by_dept["Shortage"].apply(lambda x: max(x, 0))
-            shortage_by_dept["Shortage Percentage"] = (shortage_by_dept["Shortage"] / shortage_by_dept["Required"]) * 100
-            
-            fig = px.bar(
-                shortage_by_dept,
-                x="Department",
-                y="Shortage Percentage",
-                title="Manpower Shortage by Department (%)"
-            )
-            fig.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
+        shift_filter = st.selectbox(
+            "Filter by Shift",
+            options["Auto Shift Name"],
+        )
         
-        # Detailed Data View (Common)
-        st.subheader("Detailed Data View")
-        with st.expander("View Full Data"):
-            st.dataframe(filtered_df)
+        # Rows are sorted by whole day, so the date range is two binary searches on day values
+        dates = df["Attendance Date"].to_numpy()
+        lo = dates.searchsorted(np.datetime64(start_date, "D"), side="left")
+        hi = dates.searchsorted(np.datetime64(end_date, "D"), side="right")
+        window = df.iloc[lo:hi]
+
+        # Apply the other filters as one combined mask so the window is sliced once
+        masks = [
+            value_mask(window[col], value)
+            for col, value in [
+                ("Department Name", department_filter),
+                ("Division Name", division_filter),
+                ("Direct/Indirect", direct_filter),
+                ("Skill Level", skill_filter),
+                ("Employment Type", employment_filter),
+                ("Auto Shift Name", shift_filter),
+            ]
+            if value != "All"
+        ]
+        filtered_df = window.iloc[np.flatnonzero(np.logical_and.reduce(masks))] if masks else window
+
+        # The dataset and every filter value, so the cached aggregates never rehash the filtered rows
+        filter_key = (
+            data_key, start_date, end_date, department_filter, division_filter,
+            direct_filter, skill_filter, employment_filter, shift_filter,
+        )
+    
+    # Different dashboard views
+    if dashboard_option == "General":
+        general = general_aggregates(filter_key, filtered_df)
+        render_metrics(general)
+        add_vertical_space(2)
+        render_dist_charts(general)
+        render_time_charts(filter_key, filtered_df)
+
+    elif dashboard_option == "Employee Statistics":
+        render_employee_stats(df)
+
+    elif dashboard_option == "Manpower Analysis":
+        render_manpower(filter_key, filtered_df)
+
+    elif dashboard_option == "Attendance Trends":
+        render_trends(filter_key, seed, filtered_df, attrition_df, buffer_df)
+    
+    # Detailed Data View (Common)
+    st.subheader("Detailed Data View")
+    render_data_view(filtered_df)
 
 else:
     st.info("Please upload an Excel file to start analysis")
\ No newline at end of file
@@ -1,8 +1,10 @@
-import csv
-import random
+import sys
+import numpy as np
+import pandas as pd
 from faker import Faker
 
 fake = Faker()
+rng = np.random.default_rng()
 
 # Define headers
 headers = [
@@ -22,42 +24,50 @@ rosters = ["Working Day (G)", "Holiday", "Weekend"]
 final_status = ["Present", "Absent", "Absent Half Day", "Leave"]
 attendance_types = ["Full Day", "Half Day", "Leave"]
 
-# Generate data
+# Generate data, one array per column
 num_entries = 10000
-rows = []
-
-for i in range(1, num_entries + 1):
-    emp_id = random.randint(30000, 50000)
-    f_name = fake.first_name() + " " + fake.last_name()
-    branch_code = random.choice(branch_codes)
-    department = random.choice(departments)
-    division = random.choice(divisions)
-    grade_code = random.choice(grade_codes)
-    designation = random.choice(designations)
-    direct_indirect = random.choice(direct_indirect)
-    roster = random.choice(rosters)
-    attendance_date = fake.date_between(start_date="-30d", end_date="today").strftime("%d/%m/%Y")
-    in_time = fake.time(pattern="%I:%M %p")
-    out_time = fake.time(pattern="%I:%M %p")
-    total_hours = round(random.uniform(6, 9), 2)
-    ot_hours = round(random.uniform(0, 2), 2)
-    late_hours = round(random.uniform(0, 1), 2)
-    application_status = ""  # Keeping blank as per example
-    final_stat = random.choice(final_status)
-    attendance_type = random.choice(attendance_types)
-    
-    rows.append([
-        i, emp_id, emp_id, f_name, branch_code, department, division,
-        grade_code, designation, direct_indirect, roster, attendance_date,
-        in_time, out_time, total_hours, ot_hours, late_hours, application_status,
-        final_stat, attendance_type
-    ])
-
-# Write to CSV
-csv_filename = "dummy_attendance.csv"
-with open(csv_filename, mode="w", newline="") as file:
-    writer = csv.writer(file)
-    writer.writerow(headers)
-    writer.writerows(rows)
-
-print(f"CSV file '{csv_filename}' with {num_entries} dummy entries created successfully.")
+
+# Faker is slow per call, so sample a pool of names once and pick from it
+name_pool = np.array([fake.first_name() + " " + fake.last_name() for _ in range(500)])
+
+emp_ids = rng.integers(30000, 50001, size=num_entries)
+# Dates within the last 30 days, times anywhere in the day
+attendance_dates = pd.Timestamp.today().normalize() - pd.to_timedelta(rng.integers(0, 31, size=num_entries), unit="D")
+midnight = pd.Timestamp("1970-01-01")
+in_times = midnight + pd.to_timedelta(rng.integers(0, 24 * 60, size=num_entries), unit="m")
+out_times = midnight + pd.to_timedelta(rng.integers(0, 24 * 60, size=num_entries), unit="m")
+
+columns = [
+    np.arange(1, num_entries + 1),
+    emp_ids,
+    emp_ids,
+    rng.choice(name_pool, size=num_entries),
+    rng.choice(branch_codes, size=num_entries),
+    rng.choice(departments, size=num_entries),
+    rng.choice(divisions, size=num_entries),
+    rng.choice(grade_codes, size=num_entries),
+    rng.choice(designations, size=num_entries),
+    rng.choice(direct_indirect, size=num_entries),
+    rng.choice(rosters, size=num_entries),
+    attendance_dates.strftime("%d/%m/%Y"),
+    in_times.strftime("%I:%M %p"),
+    out_times.strftime("%I:%M %p"),
+    rng.uniform(6, 9, size=num_entries).round(2),
+    rng.uniform(0, 2, size=num_entries).round(2),
+    rng.uniform(0, 1, size=num_entries).round(2),
+    "",  # Keeping blank as per example
+    rng.choice(final_status, size=num_entries),
+    rng.choice(attendance_types, size=num_entries),
+]
+
+df = pd.DataFrame(dict(zip(headers, columns)))
+
+# Write to CSV, or to a smaller and faster-to-read Parquet file with --parquet
+if "--parquet" in sys.argv[1:]:
+    parquet_filename = "dummy_attendance.parquet"
+    df.to_parquet(parquet_filename, compression="snappy", index=False)
+    print(f"Parquet file '{parquet_filename}' with {num_entries} dummy entries created successfully.")
+else:
+    csv_filename = "dummy_attendance.csv"
+    df.to_csv(csv_filename, index=False)
+    print(f"CSV file '{csv_filename}' with {num_entries} dummy entries created successfully.")
@@ -0,0 +1,336 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import io
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time
+
+# Define expected columns
+EXPECTED_COLUMNS = [
+    "Sr. No.",
+    "EmpID",
+    "Attendance Code",
+    "FName",
+    "Branch Code",
+    "Department Name",
+    "Division Name",
+    "ReportingEmpCode",
+    "ReportingEmpName",
+    "Grade Code",
+    "Designation Name",
+    "Direct/Indirect",
+    "Roster",
+    "Auto Shift Name",
+    "Date of Joining",
+    "Attendance Date",
+    "In Time",
+    "Out Time",
+    "Total Hours",
+    "OT Hours",
+    "Late Hours",
+    "Application Status",
+    "Final Status",
+    "Attendance Type",
+]
+
+# Numeric columns, filled with 0 when missing; everything else falls back to "Unknown"
+HOURS_COLUMNS = ["Total Hours", "OT Hours", "Late Hours"]
+# ReportingEmpCode holds numeric employee codes, so its gaps take 0 rather than text
+NUMERIC_COLUMNS = ["Sr. No.", "ReportingEmpCode"] + HOURS_COLUMNS
+FILL_DEFAULTS = {col: 0 if col in NUMERIC_COLUMNS else "Unknown" for col in EXPECTED_COLUMNS}
+
+# Columns holding a small set of repeated labels
+CATEGORY_COLUMNS = [
+    "EmpID",
+    "Attendance Code",
+    "FName",
+    "Department Name",
+    "Division Name",
+    "Direct/Indirect",
+    "Final Status",
+    "Attendance Type",
+    "Skill Level",
+    "Employment Type",
+    "Auto Shift Name",
+    "Gender",
+    "Production Line",
+]
+
+
+# Parse one sheet, skipping it when it holds no attendance records
+def read_sheet(file_bytes, sheet):
+    """Open the workbook separately so sheets can be parsed on parallel threads"""
+    xl = pd.ExcelFile(io.BytesIO(file_bytes), engine="calamine")
+    # Read the header row first and only parse sheets holding attendance records
+    if "Attendance Date" not in xl.parse(sheet, nrows=0).columns:
+        return None
+    return xl.parse(sheet, usecols=lambda col: col in EXPECTED_COLUMNS)
+
+# Load data from Excel, parsed once per uploaded file and kept on disk across sessions
+@st.cache_data(show_spinner=True, max_entries=4, persist="disk")
+def load_data(file_bytes):
+    sheet_names = pd.ExcelFile(io.BytesIO(file_bytes), engine="calamine").sheet_names
+    with ThreadPoolExecutor(max_workers=max(1, min(len(sheet_names), os.cpu_count() or 1))) as pool:
+        frames = pool.map(lambda sheet: read_sheet(file_bytes, sheet), sheet_names)
+        data = {sheet: frame for sheet, frame in zip(sheet_names, frames) if frame is not None}
+    return data, list(data)
+
+# Preprocess data
+def preprocess_data(df):
+    # Ensure all expected columns exist, in one reindex
+    df = df.reindex(columns=EXPECTED_COLUMNS)
+
+    # Convert columns to string where necessary
+    for col in ["Attendance Code", "Roster", "EmpID"]:  
+        if col in df.columns:
+            df[col] = df[col].astype(str)
+
+    # Convert 'Attendance Date' to datetime safely
+    df["Attendance Date"] = pd.to_datetime(df["Attendance Date"], errors="coerce")
+
+    # Remove rows where 'Attendance Date' couldn't be converted
+    df = df.dropna(subset=["Attendance Date"])
+
+    # Narrow the numeric columns, stray text becomes a gap that is filled with 0 below
+    for col in HOURS_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+    df["Sr. No."] = pd.to_numeric(df["Sr. No."], errors="coerce").round().astype("Int32")
+
+    # Only columns that actually hold gaps are filled, the rest are left untouched
+    na_cols = df.columns[df.isna().any().to_numpy()]
+    df = df.fillna({col: FILL_DEFAULTS[col] for col in na_cols})
+    return df
+
+# Store columns in the narrowest dtype that holds them
+def compact_dtypes(df):
+    """Cast repeated labels to categoricals and hours to float32 on the assembled dataset"""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    # Columns that still hold stray text are left as they are
+    return df.astype(
+        {col: "float32" for col in HOURS_COLUMNS if col in df.columns}, errors="ignore"
+    )
+
+# Extract the hour from In/Out Time values
+def time_to_hour(times):
+    """Take the hour off time and datetime cells, parse text cells, and drop every other value"""
+    if pd.api.types.is_datetime64_any_dtype(times):
+        return times.dt.hour.astype("Int8")
+    values = times.to_numpy(dtype=object)
+    hours = np.full(len(values), np.nan)
+    # datetime.datetime and pd.Timestamp are both read here, numbers such as footer totals are not
+    is_time = np.array([isinstance(v, (time, datetime)) for v in values], dtype=bool)
+    hours[is_time] = [v.hour for v in values[is_time]]
+    is_text = np.array([isinstance(v, str) for v in values], dtype=bool)
+    if is_text.any():
+        parsed = pd.to_datetime(pd.Series(values[is_text]), format="mixed", errors="coerce")
+        hours[is_text] = parsed.dt.hour.to_numpy(dtype=float, na_value=np.nan)
+    return pd.Series(hours, index=times.index).astype("Int8")
+
+# Add the In/Out hour columns the peak time charts count
+def add_hour_columns(df):
+    """Extract the hours before the synthetic rows copy them, so each time is parsed only once"""
+    df["In Hour"] = time_to_hour(df["In Time"])
+    df["Out Hour"] = time_to_hour(df["Out Time"])
+    return df
+
+# Final pass shared by uploaded and demo data
+def finish_dataset(df):
+    """Compact the dtypes and sort rows by whole day for range slicing"""
+    df = compact_dtypes(df)
+    # Whole days, so a date range end includes every row of its last day
+    df["Attendance Date"] = df["Attendance Date"].dt.normalize()
+    return df.sort_values("Attendance Date", kind="stable", ignore_index=True)
+
+# Spread one value per employee over that employee's rows
+def per_employee(values, emp_codes):
+    """Build the column as a categorical straight away, so the rows only hold small integer codes"""
+    categories, codes = np.unique(values, return_inverse=True)
+    return pd.Categorical.from_codes(codes[emp_codes], categories=categories)
+
+# Generate synthetic data for new metrics
+def generate_synthetic_data(df, today, seed):
+    """Generate additional data that might not be in the original dataset"""
+    rng = np.random.default_rng(seed)
+    num_employees = df["EmpID"].nunique() or 100
+    
+    # Add skill levels (L1, L2, L3, L4)
+    emp_codes, unique_employees = df["EmpID"].factorize()
+    n_emp = len(unique_employees)
+    skill_levels = rng.choice(["L1", "L2", "L3", "L4"], size=n_emp)
+    
+    df["Skill Level"] = per_employee(skill_levels, emp_codes)
+    
+    # Add employment type (Permanent/Temporary)
+    employment_types = rng.choice(["Permanent", "Temporary"], size=n_emp)
+    
+    df["Employment Type"] = per_employee(employment_types, emp_codes)
+    
+    # Add production line assignment
+    production_lines = np.char.add("Line ", rng.integers(1, 11, size=n_emp).astype(str))
+    
+    df["Production Line"] = per_employee(production_lines, emp_codes)
+    
+    # Add gender information
+    genders = rng.choice(["Male", "Female"], size=n_emp)
+    
+    df["Gender"] = per_employee(genders, emp_codes)
+    
+    # Add shift information if not present, preprocess_data has already filled blank shifts with "Unknown"
+    if "Auto Shift Name" not in df.columns or df["Auto Shift Name"].fillna("Unknown").eq("Unknown").all():
+        shifts = rng.choice(["Morning", "Afternoon", "Night"], size=n_emp)
+        df["Auto Shift Name"] = per_employee(shifts, emp_codes)
+    
+    # Generate historical attendance data
+    today = pd.Timestamp(today)
+    
+    # Get range of dates to simulate history
+    date_range = today - pd.to_timedelta(np.arange(180), unit="D")
+
+    # One slot per employee and date, laid out as an (employees, days) grid
+    shape = (n_emp, len(date_range))
+
+    # Skip weekends with higher probability
+    keep = ~((date_range.weekday >= 5) & (rng.random(shape) < 0.8))
+    emp_idx, day_idx = np.nonzero(keep)
+
+    # Status codes come from the cumulative weights, so only small ints are drawn
+    status_codes = np.searchsorted(np.cumsum([0.85, 0.07, 0.05]), rng.random(shape), side="right")
+    attendance_status = pd.Categorical.from_codes(
+        status_codes[keep], categories=["P", "Absent", "Leave", "Half Day"]
+    )
+
+    # Copy the employee data from each employee's first row, found in one pass
+    # drop_duplicates keeps the factorize order, so row i holds employee i and a take replaces the join
+    first_rows = df.drop_duplicates("EmpID").drop(columns=["EmpID", "Attendance Date", "Final Status"])
+
+    synthetic_df = pd.DataFrame({
+        "EmpID": unique_employees[emp_idx],
+        "Attendance Date": date_range[day_idx],
+        "Final Status": attendance_status,
+        **{col: first_rows[col].array.take(emp_idx) for col in first_rows.columns},
+    }, copy=False)
+    
+    # If there's existing data, combine it with the synthetic data
+    # concat aligns the columns itself, both frames already share them
+    if len(df) > 0:
+        combined_df = pd.concat([df, synthetic_df], ignore_index=True, copy=False)
+    else:
+        combined_df = synthetic_df
+    
+    return combined_df
+
+# Synthetic attrition and buffer manpower frames, built once per day and seed
+@st.cache_data(show_spinner=False, max_entries=4)
+def synthetic_aux_frames(today, seed):
+    """Build the monthly attrition and daily required/available manpower frames"""
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp(today)
+
+    # Create synthetic attrition data
+    attrition_df = pd.DataFrame({
+        "Month": pd.date_range(end=today, periods=12, freq='ME').strftime('%Y-%m'),
+        "Attrition_Rate": rng.uniform(0.01, 0.08, size=12)
+    })
+    
+    # Create buffer manpower data
+    buffer_df = pd.DataFrame({
+        "Date": pd.date_range(end=today, periods=31, freq='D'),
+        "Required": rng.integers(80, 101, size=31),
+        "Available": rng.integers(70, 96, size=31)
+    })
+    return attrition_df, buffer_df
+
+# Seed for everything simulated on top of an uploaded file
+def dataset_seed(file_bytes):
+    """Derive the seed from the file contents, so the same upload always simulates the same values"""
+    return int.from_bytes(hashlib.blake2b(file_bytes, digest_size=8).digest(), "little")
+
+# Build the full dataset once per uploaded file and day so widget reruns skip parsing and generation
+@st.cache_data(show_spinner=True, max_entries=4)
+def build_dataset(file_bytes, today):
+    """Parse, clean and extend an uploaded workbook into the frames the dashboards read"""
+    data, sheets = load_data(file_bytes)
+    all_sheets_df = add_hour_columns(preprocess_data(
+        pd.concat([data[sheet] for sheet in sheets], ignore_index=True, copy=False)
+    ))
+    # Without any dated rows there is nothing to analyse, let the caller fall back to demo data
+    if all_sheets_df.empty:
+        raise ValueError("No attendance records found in the uploaded file")
+    # Add synthetic data, seeded from the file so a rebuild after cache eviction draws the same rows
+    seed = dataset_seed(file_bytes)
+    df = generate_synthetic_data(all_sheets_df, today, seed)
+    attrition_df, buffer_df = synthetic_aux_frames(today, seed)
+    return finish_dataset(df), attrition_df, buffer_df
+
+# Generate completely synthetic data for demo, built once and reused on every rerun
+@st.cache_data(show_spinner=True, max_entries=1)
+def generate_demo_data(today, seed=0):
+    """Build attendance, attrition and buffer frames from scratch"""
+    # Seed one generator locally so the cached demo is reproducible
+    rng = np.random.default_rng(seed)
+
+    # Generate sample employee data
+    num_employees = 100
+    departments = ["Production", "Quality", "Maintenance", "HR", "Administration"]
+    divisions = ["A", "B", "C"]
+    skill_levels = ["L1", "L2", "L3", "L4"]
+    shifts = ["Morning", "Afternoon", "Night"]
+    genders = ["Male", "Female"]
+
+    # Generate employee base data, each attribute drawn for every employee at once
+    # Repeating the employee rows below then only copies categorical codes
+    numbers = np.arange(1, num_employees + 1).astype(str)
+    employees = pd.DataFrame({
+        "EmpID": np.char.add("EMP", np.char.zfill(numbers, 3)),
+        "FName": np.char.add("Employee ", numbers),
+        "Department Name": rng.choice(departments, size=num_employees),
+        "Division Name": rng.choice(divisions, size=num_employees),
+        "Skill Level": rng.choice(skill_levels, size=num_employees),
+        "Auto Shift Name": rng.choice(shifts, size=num_employees),
+        "Gender": rng.choice(genders, size=num_employees),
+        "Employment Type": rng.choice(["Permanent", "Temporary"], size=num_employees),
+        "Production Line": np.char.add("Line ", rng.integers(1, 11, size=num_employees).astype(str)),
+    }).astype("category")
+
+    # Generate attendance data on an employee-by-day grid
+    dates = np.datetime64(today, "D") - np.arange(90).astype("timedelta64[D]")
+    shape = (len(employees), len(dates))
+
+    # Skip weekends with higher probability
+    weekend = pd.DatetimeIndex(dates).weekday >= 5
+    emp_idx, day_idx = np.nonzero(~(weekend & (rng.random(shape) < 0.8)))
+    n_rows = len(emp_idx)
+
+    # Draw small status codes and label them as categoricals, no per-row strings are built
+    status_codes = rng.choice(4, size=n_rows, p=[0.85, 0.07, 0.05, 0.03])
+    present = status_codes == 0
+    worked = present | (status_codes == 3)
+
+    in_minutes = 8 * 60 + rng.integers(0, 61, size=n_rows)
+    shift_minutes = 8 * 60 + rng.integers(0, 61, size=n_rows)
+    in_time = dates[day_idx].astype("datetime64[m]") + in_minutes
+    out_time = in_time + shift_minutes
+    # Hours come straight from the drawn shift length instead of subtracting the timestamps
+    total_hours = shift_minutes / 60
+
+    # Create dataframe once from the employee columns repeated per row and the attendance columns
+    df = pd.DataFrame({
+        **{col: employees[col].array.take(emp_idx) for col in employees.columns},
+        "Attendance Date": dates[day_idx],
+        "Final Status": pd.Categorical.from_codes(status_codes, categories=["P", "Absent", "Leave", "Half Day"]),
+        "In Time": np.where(worked, in_time, np.datetime64("NaT")),
+        "Out Time": np.where(worked, out_time, np.datetime64("NaT")),
+        "Total Hours": np.where(worked, total_hours, 0),
+        "OT Hours": np.where(present, np.maximum(total_hours - 8, 0), 0),
+        "Late Hours": np.where(rng.random(n_rows) < 0.2, rng.uniform(0, 1, size=n_rows), 0),
+        "Attendance Type": pd.Categorical.from_codes(status_codes, categories=["Regular", "Absent", "Leave", "Half Day"]),
+    }, copy=False)
+    df = add_hour_columns(df)
+
+    attrition_df, buffer_df = synthetic_aux_frames(today, seed)
+
+    return finish_dataset(df), attrition_df, buffer_df